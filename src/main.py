@@ -4,13 +4,20 @@ from dotenv import load_dotenv
 from youtube.downloader import download_content
 from youtube.extractor import extract_video_info
 from youtube.api_extractor import extract_playlist_videos_api
-from summarizer.summary import summarize_video
+from summarizer.summary import summarize_video, summarize_videos_basic
 from notion.client import NotionClient
 
 # Fix SSL certificate issues - place this BEFORE main() function
 ssl._create_default_https_context = ssl._create_unverified_context
 
 
+def get_save_page(notion_client):
+    """Pick create or upsert depending on the NOTION_UPSERT setting"""
+    if os.getenv("NOTION_UPSERT", "false").lower() == "true":
+        return notion_client.upsert_page
+    return notion_client.create_page
+
+
 def main():
     # Load environment variables
     load_dotenv()
@@ -28,16 +35,26 @@ def main():
         # Initialize Notion client with token
         notion_client = NotionClient(os.getenv("API_KEY_NOTION"))
         notion_database_id = os.getenv("NOTION_DATABASE_ID")
+        save_page = get_save_page(notion_client)
 
         # Reverse the videos list to maintain chronological order in Notion
         videos_info.reverse()
 
+        # Without Groq, basic summaries are CPU-bound, so build them in parallel
+        basic_summaries = None
+        if not os.getenv("GROQ_API_KEY"):
+            print("Groq API key not found. Using basic summarization for all videos.")
+            basic_summaries = summarize_videos_basic(videos_info)
+
         # Process each video in the playlist
-        for video_info in videos_info:
+        for index, video_info in enumerate(videos_info):
             print(f"Processing video: {video_info['title']}")
-            summary = summarize_video(video_info)
+            if basic_summaries is not None:
+                summary = basic_summaries[index]
+            else:
+                summary = summarize_video(video_info)
             print("Generated summary, saving to Notion...")
-            notion_client.create_page(
+            save_page(
                 notion_database_id,
                 video_info["title"],
                 summary,
@@ -52,11 +69,12 @@ def main():
         # Initialize Notion client with token
         notion_client = NotionClient(os.getenv("API_KEY_NOTION"))
         notion_database_id = os.getenv("NOTION_DATABASE_ID")
+        save_page = get_save_page(notion_client)
 
         print(f"Processing video: {video_info['title']}")
         summary = summarize_video(video_info)
         print("Generated summary, saving to Notion...")
-        notion_client.create_page(
+        save_page(
             notion_database_id, video_info["title"], summary, video_url=user_input
         )
         print(f"Processed video: {video_info['title']}")
@@ -1,9 +1,17 @@
 import os
 import re
+import json
+import difflib
+import hashlib
 import requests
 
 
 class NotionClient:
+    # Optional rich_text property used to skip pages whose content is unchanged
+    CONTENT_HASH_PROPERTY = "Content Hash"
+    # Notion accepts at most 100 children per append request
+    MAX_CHILDREN_PER_REQUEST = 100
+
     def __init__(self, api_key):
         self.api_key = api_key
         self.base_url = "https://api.notion.com/v1"
@@ -12,8 +20,9 @@ class NotionClient:
             "Content-Type": "application/json",
             "Notion-Version": "2022-06-28",
         }
+        self._database_properties = {}
 
-    def create_page(self, database_id, title, content, video_url=""):
+    def create_page(self, database_id, title, content, video_url="", properties=None):
         """Create a page in Notion database with the given title and content."""
         print(f"Created page '{title}' in Notion, now adding summary content...")
 
@@ -26,6 +35,8 @@ class NotionClient:
             },
             "children": self._parse_markdown_to_blocks(content),
         }
+        if properties:
+            page_data["properties"].update(properties)
 
         # Create the page
         response = requests.post(
@@ -37,6 +48,217 @@ class NotionClient:
 
         return response.json()
 
+    def upsert_page(self, database_id, title, content, video_url=""):
+        """
+        Create a page, or update the existing page for the same video in place.
+
+        The existing page is looked up through a filtered database query on the
+        "Video URL" property. When the database has a "Content Hash" property and
+        the stored hash matches the new content, the page is left untouched.
+        Otherwise only the blocks that differ are archived, patched or appended.
+
+        Args:
+            database_id (str): The Notion database ID
+            title (str): The page title
+            content (str): The markdown summary
+            video_url (str): The YouTube video URL used to identify the page
+
+        Returns:
+            dict: The created or existing Notion page
+        """
+        blocks = self._parse_markdown_to_blocks(content)
+        content_hash = self._content_hash(title, blocks)
+        has_hash_property = self._has_property(
+            database_id, self.CONTENT_HASH_PROPERTY
+        )
+
+        page = self.find_page_by_video(database_id, video_url) if video_url else None
+        if page is None:
+            properties = {}
+            if has_hash_property:
+                properties[self.CONTENT_HASH_PROPERTY] = {
+                    "rich_text": [{"text": {"content": content_hash}}]
+                }
+            return self.create_page(
+                database_id, title, content, video_url=video_url, properties=properties
+            )
+
+        if has_hash_property and self._stored_hash(page) == content_hash:
+            print(f"Page '{title}' is unchanged in Notion, skipping update.")
+            return page
+
+        print(f"Found existing page '{title}' in Notion, updating changed blocks...")
+        existing_blocks = self._list_children(page["id"])
+        self._apply_block_diff(page["id"], existing_blocks, blocks)
+
+        properties = {"Name": {"title": [{"text": {"content": title}}]}}
+        if has_hash_property:
+            properties[self.CONTENT_HASH_PROPERTY] = {
+                "rich_text": [{"text": {"content": content_hash}}]
+            }
+        return self._request(
+            "patch",
+            f"/pages/{page['id']}",
+            {"properties": properties},
+            "Error updating Notion page",
+        )
+
+    def find_page_by_video(self, database_id, video_url):
+        """Find the page for a video by its URL or video ID, or return None."""
+        video_id = self._extract_video_id(video_url)
+        if video_id:
+            url_filter = {"contains": video_id}
+        else:
+            url_filter = {"equals": video_url}
+
+        result = self._request(
+            "post",
+            f"/databases/{database_id}/query",
+            {
+                "filter": {"property": "Video URL", "url": url_filter},
+                "page_size": 1,
+            },
+            "Error querying Notion database",
+        )
+        pages = result.get("results", [])
+        return pages[0] if pages else None
+
+    def _apply_block_diff(self, page_id, existing_blocks, new_blocks):
+        """Bring the page's top-level blocks in line with new_blocks."""
+        old_keys = [self._block_key(block) for block in existing_blocks]
+        new_keys = [self._block_key(block) for block in new_blocks]
+        matcher = difflib.SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+
+        after = None
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                after = existing_blocks[i2 - 1]["id"]
+                continue
+
+            old = existing_blocks[i1:i2]
+            new = new_blocks[j1:j2]
+
+            # Patch blocks in place while their types line up
+            while old and new and self._block_type(old[0]) == self._block_type(new[0]):
+                self._patch_block(old[0], new[0])
+                after = old[0]["id"]
+                old, new = old[1:], new[1:]
+
+            # Notion can only insert after an existing block, so content that
+            # has to go in front of the first kept block needs a full rewrite.
+            if new and after is None and i2 < len(existing_blocks):
+                for block in existing_blocks:
+                    self._archive_block(block["id"])
+                self._append_children(page_id, new_blocks)
+                return
+
+            for block in old:
+                self._archive_block(block["id"])
+            if new:
+                after = self._append_children(page_id, new, after=after)
+
+    def _list_children(self, block_id):
+        """Fetch all top-level child blocks of a page, following pagination."""
+        blocks = []
+        cursor = None
+        while True:
+            url = f"/blocks/{block_id}/children?page_size=100"
+            if cursor:
+                url += f"&start_cursor={cursor}"
+            result = self._request("get", url, None, "Error fetching Notion blocks")
+            blocks.extend(result.get("results", []))
+            if not result.get("has_more"):
+                return blocks
+            cursor = result.get("next_cursor")
+
+    def _append_children(self, block_id, children, after=None):
+        """Append children in batches and return the ID of the last new block."""
+        for start in range(0, len(children), self.MAX_CHILDREN_PER_REQUEST):
+            body = {"children": children[start : start + self.MAX_CHILDREN_PER_REQUEST]}
+            if after:
+                body["after"] = after
+            result = self._request(
+                "patch",
+                f"/blocks/{block_id}/children",
+                body,
+                "Error appending Notion blocks",
+            )
+            ids = [block["id"] for block in result.get("results", [])]
+            if after in ids:
+                # Some API versions return every child; find the ones we added
+                ids = ids[ids.index(after) + 1 :][: len(body["children"])]
+            if ids:
+                after = ids[-1]
+        return after
+
+    def _patch_block(self, old_block, new_block):
+        block_type = self._block_type(new_block)
+        self._request(
+            "patch",
+            f"/blocks/{old_block['id']}",
+            {block_type: new_block[block_type]},
+            "Error updating Notion block",
+        )
+
+    def _archive_block(self, block_id):
+        self._request(
+            "delete", f"/blocks/{block_id}", None, "Error archiving Notion block"
+        )
+
+    def _has_property(self, database_id, name):
+        """Check the database schema (cached per database) for a property."""
+        if database_id not in self._database_properties:
+            database = self._request(
+                "get",
+                f"/databases/{database_id}",
+                None,
+                "Error fetching Notion database",
+            )
+            self._database_properties[database_id] = database.get("properties", {})
+        return name in self._database_properties[database_id]
+
+    def _stored_hash(self, page):
+        prop = page.get("properties", {}).get(self.CONTENT_HASH_PROPERTY, {})
+        return "".join(part.get("plain_text", "") for part in prop.get("rich_text", []))
+
+    def _content_hash(self, title, blocks):
+        payload = json.dumps([title, blocks], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _block_type(self, block):
+        if "type" in block:
+            return block["type"]
+        return next(key for key in block if key != "object")
+
+    def _block_key(self, block):
+        """Comparable form of a block, for both API and locally compiled blocks."""
+        block_type = self._block_type(block)
+        rich_text = block.get(block_type, {}).get("rich_text", [])
+        return (
+            block_type,
+            tuple(
+                (
+                    part.get("text", {}).get("content", part.get("plain_text", "")),
+                    bool(part.get("annotations", {}).get("bold")),
+                )
+                for part in rich_text
+            ),
+        )
+
+    def _extract_video_id(self, url):
+        match = re.search(r"(?:v=|youtu\.be/|embed/|shorts/)([0-9A-Za-z_-]{11})", url)
+        return match.group(1) if match else None
+
+    def _request(self, method, path, body, error_message):
+        response = requests.request(
+            method, f"{self.base_url}{path}", headers=self.headers, json=body
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"{error_message}: {response.text}")
+
+        return response.json()
+
     def _parse_markdown_to_blocks(self, markdown_content):
         """Parse markdown content into Notion blocks"""
         blocks = []
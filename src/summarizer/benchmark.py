@@ -0,0 +1,52 @@
+"""
+Benchmark for parallel basic summarization.
+
+Run from the src directory:
+    python -m summarizer.benchmark [num_videos]
+"""
+import os
+import sys
+import time
+from summarizer.summary import summarize_videos_basic
+
+
+def make_videos(count, sentences=400):
+    """Build synthetic videos with long transcripts"""
+    sentence = (
+        "Dr. Smith explains how the model handles 3.5 million tokens per second. "
+        "Then the speaker moves on to the next topic, e.g. caching and batching! "
+    )
+    return [
+        {"title": f"Benchmark Video {i}", "transcript": sentence * sentences}
+        for i in range(count)
+    ]
+
+
+def run_benchmark(num_videos=400):
+    videos = make_videos(num_videos)
+    max_cores = os.cpu_count() or 1
+
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= max_cores:
+        worker_counts.append(worker_counts[-1] * 2)
+    if worker_counts[-1] != max_cores:
+        worker_counts.append(max_cores)
+
+    print(f"Summarizing {num_videos} videos on {max_cores} cores")
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        summaries = summarize_videos_basic(videos, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        assert len(summaries) == num_videos
+
+        baseline = baseline or elapsed
+        speedup = baseline / elapsed
+        print(
+            f"{workers:>3} workers: {elapsed:7.2f}s  "
+            f"speedup {speedup:5.2f}x  efficiency {speedup / workers:5.0%}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 400)
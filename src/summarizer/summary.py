@@ -1,5 +1,6 @@
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 import nltk
 from nltk.tokenize import sent_tokenize
 from groq import Groq
@@ -25,19 +26,9 @@ def summarize_video(video_info, verbose=True):
     Returns:
         str: A structured, formatted summary of the video content
     """
-    # Get transcript from video_info
-    transcript = video_info.get("transcript", "")
-    title = video_info.get("title", "Unknown Video")
-    description = video_info.get("description", "")
-
-    # If no transcript, use description or return a message
-    if not transcript or transcript == "Transcript unavailable":
-        if description:
-            content = description
-        else:
-            return "No transcript or description available for summarization."
-    else:
-        content = transcript
+    title, content = _get_summary_content(video_info)
+    if not content:
+        return "No transcript or description available for summarization."
 
     # Use Groq if API key is available, otherwise fall back to basic summarization
     groq_key = os.getenv("GROQ_API_KEY")
@@ -58,6 +49,17 @@ def summarize_video(video_info, verbose=True):
         return basic_structured_summary(title, content)
 
 
+def _get_summary_content(video_info):
+    """Return the title and the text to summarize (transcript, else description)"""
+    transcript = video_info.get("transcript", "")
+    title = video_info.get("title", "Unknown Video")
+    description = video_info.get("description", "")
+
+    if not transcript or transcript == "Transcript unavailable":
+        return title, description
+    return title, transcript
+
+
 def groq_structured_summary(title, content, api_key):
     """Generate a structured summary using Groq"""
     try:
@@ -200,3 +202,48 @@ def summarize_playlist(playlist_videos):
     for video in playlist_videos:
         summary = summarize_video(video)
         summaries.append(summary)
+
+
+def _init_basic_worker():
+    """Load the NLTK sentence tokenizer once per worker process"""
+    sent_tokenize("Warm up.")
+
+
+def _basic_summary_worker(video_info):
+    title, content = _get_summary_content(video_info)
+    if not content:
+        return "No transcript or description available for summarization."
+    return basic_structured_summary(title, content)
+
+
+def summarize_videos_basic(videos, max_workers=None, chunksize=None):
+    """
+    Summarizes many videos with basic summarization, spread over a process pool.
+
+    Intended for large backfills without a Groq key, where sentence tokenization
+    would otherwise keep the whole run on a single core.
+
+    Args:
+        videos (list): A list of dictionaries, each containing video details.
+        max_workers (int): Number of worker processes (defaults to the CPU count).
+        chunksize (int): Videos sent to a worker per task (defaults to a size that
+            gives each worker about four chunks).
+
+    Returns:
+        list: Summaries in the same order as the input videos.
+    """
+    videos = list(videos)
+    if not videos:
+        return []
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(videos) == 1:
+        return [_basic_summary_worker(video) for video in videos]
+
+    if chunksize is None:
+        chunksize = max(1, len(videos) // (max_workers * 4))
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_basic_worker
+    ) as executor:
+        return list(executor.map(_basic_summary_worker, videos, chunksize=chunksize))